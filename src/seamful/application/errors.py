@@ -187,7 +187,7 @@ class ResolutionStep:
         m = self.provider_method
         return (
             f"{rname(self.target)} -> "
-            f"{m.provider.__name__}.provide_{self.target.name}"
+            f"{m.provider.__name__}.{self.target.provider_method_name}"
             f"(..., {self.parameter_name}: {rname(self.depends_on)})"
         )
 
@@ -241,7 +241,9 @@ class ProviderMethodsCantAccessProviderInstance(HelpfulException):
     def explanation(self) -> str:
         t = Text("Provider method:")
         with t.indented_block():
-            t.newline(f"{sname(self.provider_method.provider)}.provide_{self.resource.name}()")
+            t.newline(
+                f"{sname(self.provider_method.provider)}.{self.resource.provider_method_name}()"
+            )
         t.newline("Attempted to access the provider instance 'self'.")
         t.sentence(
             "Provider methods can only access their parameters, " "but not the provider instance"
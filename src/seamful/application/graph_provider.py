@@ -17,6 +17,8 @@ from seamful.resource import (
 
 T = TypeVar("T")
 
+_MISSING: Any = object()
+
 
 class ProviderResourcesNotAllowed(Exception):
     def __init__(self, resource: ProviderResource[Any]):
@@ -60,8 +62,9 @@ class ModuleGraphProvider:
             )
 
     def _provide(self, resource: BoundResource[T]) -> T:
-        if resource in self._instances_by_resource:
-            return cast(T, self._instances_by_resource[resource])
+        instance = self._instances_by_resource.get(resource, _MISSING)
+        if instance is not _MISSING:
+            return cast(T, instance)
         if isinstance(resource, OverridingResource):
             return self._provide(cast(OverridingResource[T], resource.overrides))
 
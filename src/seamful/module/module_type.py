@@ -18,7 +18,8 @@ from seamful.module.errors import (
 from seamful.resource import (
     ModuleResource,
     UnboundResource,
-    ProviderResource,
+    PrivateResource,
+    OverridingResource,
     ResourceKind,
 )
 
@@ -28,11 +29,11 @@ if TYPE_CHECKING:
 
 class ModuleType(type):
     _resources_by_name: dict[str, ModuleResource[Any]]
-    _resources: set[ModuleResource[Any]]
+    _resources_tuple: tuple[ModuleResource[Any], ...]
     _default_provider: Optional[ProviderType]
 
     def __init__(self, name: str, bases: tuple[type, ...], dct: dict[str, Any]):
-        self._resources = set()
+        self._resources_tuple = tuple()
         self._resources_by_name = {}
         self._default_provider = None
         type.__init__(self, name, bases, dct)
@@ -41,20 +42,21 @@ class ModuleType(type):
         if bases[0] != Module:
             raise ModulesMustInheritDirectlyFromModuleClass(name, bases)
         self._collect_resources(dct)
+        self._resources_tuple = tuple(self._resources_by_name.values())
 
     def __call__(self, *args: Any, **kwargs: Any) -> None:
         raise ModulesCannotBeInstantiated(self)
 
     def __contains__(self, item: str | ModuleResource[Any]) -> bool:
         if type(item) is ModuleResource:
-            return item in self._resources
+            return self._resources_by_name.get(item.name) == item
         elif type(item) is str:
             return item in self._resources_by_name
         else:
             raise TypeError()
 
     def __iter__(self) -> Iterator[ModuleResource[Any]]:
-        return iter(self._resources)
+        return iter(self._resources_tuple)
 
     def __getitem__(self, name: str) -> ModuleResource[Any]:
         return self._resources_by_name[name]
@@ -87,23 +89,23 @@ class ModuleType(type):
             raise InvalidPrivateModuleAttribute(self, name, candidate)
         elif name == "default_provider":
             raise InvalidModuleAttributeName(self, name, candidate)
-        if isinstance(candidate, UnboundResource):
+        candidate_type = type(candidate)
+        if candidate_type is UnboundResource:
             if candidate.kind == ResourceKind.OVERRIDE:
                 raise InvalidOverridingResourceInModule(self, name, candidate.type)
             elif candidate.kind == ResourceKind.PRIVATE:
                 raise InvalidPrivateResourceInModule(self, name, candidate.type)
             return ModuleResource(candidate.type, name, self)
-        elif isinstance(candidate, ModuleResource):
+        elif candidate_type is ModuleResource:
             raise CannotUseExistingModuleResource(self, name, candidate)
-        elif isinstance(candidate, ProviderResource):
+        elif candidate_type is PrivateResource or candidate_type is OverridingResource:
             raise InvalidPrivateResourceInModule(self, name, candidate.type)
         elif isinstance(candidate, type):
-            return ModuleResource[Any](candidate, name, self)
+            return ModuleResource(candidate, name, self)
         else:
             raise InvalidModuleAttributeType(self, name, candidate)
 
     def _add_resource(self, resource: ModuleResource[Any]) -> None:
-        self._resources.add(resource)
         self._resources_by_name[resource.name] = resource
         setattr(self, resource.name, resource)
 
@@ -34,6 +34,14 @@ class TestModuleResourcesFromTypeAlias(TestCase):
         self.assertEqual(resource.type, int)
         self.assertEqual(resource.module, SomeModule)
 
+    def test_module_lists_resources_in_declaration_order(self) -> None:
+        class SomeModule(Module):
+            c = int
+            a = Resource(str)
+            b = float
+
+        self.assertEqual([resource.name for resource in SomeModule], ["c", "a", "b"])
+
     @skipIf(sys.version_info < (3, 10), "Type aliases are not supported")
     def test_module_collects_resources_from_explicit_type_aliases(self) -> None:
         from typing import TypeAlias
@@ -58,7 +58,7 @@ class ProviderMethodNotCallable(HelpfulException):
 
     def explanation(self) -> str:
         t = Text(
-            f"{sname(self.provider)}.provide_{self.resource.name} looks like "
+            f"{sname(self.provider)}.{self.resource.provider_method_name} looks like "
             "a provider method for"
         )
         with t.indented_block():
@@ -211,7 +211,7 @@ class ProviderMethodMissingReturnTypeAnnotation(HelpfulException):
         self.method = method
 
     def explanation(self) -> str:
-        t = Text(f"The provider method {sname(self.provider)}.provide_{self.resource.name}")
+        t = Text(f"The provider method {sname(self.provider)}.{self.resource.provider_method_name}")
         t.sentence("doesn't have a return type. ")
         t.newline("All provider methods must have a return type annotation compatible with")
         t.sentence("the resource they provide for. In this case it provides for")
@@ -244,7 +244,7 @@ class ProviderMethodReturnTypeMismatch(HelpfulException):
         t = Text("The provider method")
         with t.indented_block():
             t.newline(
-                f"{sname(self.provider)}.provide_{self.resource.name}() -> "
+                f"{sname(self.provider)}.{self.resource.provider_method_name}() -> "
                 f"{sname(self.mismatched_type)} "
             )
         t.sentence("provides for")
@@ -282,7 +282,7 @@ class ProviderMethodParameterMissingTypeAnnotation(HelpfulException):
         t = Text("The provider method")
         with t.indented_block():
             t.newline(
-                f"{sname(self.provider)}.provide_{self.provides.name}"
+                f"{sname(self.provider)}.{self.provides.provider_method_name}"
                 f"(..., {self.parameter_name}, ...) -> {sname(self.provides.type)}"
             )
         t.newline(f"is missing a type annotation for parameter {self.parameter_name}.")
@@ -313,7 +313,7 @@ class ProviderMethodParameterUnrelatedName(HelpfulException):
         t = Text("In provider method")
         with t.indented_block():
             t.newline(
-                f"{sname(self.provider)}.provide_{self.provides.name}"
+                f"{sname(self.provider)}.{self.provides.provider_method_name}"
                 f"(..., {self.parameter_name}: {sname(self.parameter_type)}, "
                 f"...) -> {sname(self.provides.type)}"
             )
@@ -351,7 +351,7 @@ class ProviderMethodParameterInvalidTypeAnnotation(HelpfulException):
         t = Text("In provider method")
         with t.indented_block():
             t.newline(
-                f"{sname(self.provider)}.provide_{self.provides.name}"
+                f"{sname(self.provider)}.{self.provides.provider_method_name}"
                 f"(..., {self.parameter_name}: {repr(self.mismatched_type)}, "
                 f"...) -> {sname(self.provides.type)}"
             )
@@ -392,7 +392,7 @@ class ProviderMethodParameterMatchesResourceNameButNotType(HelpfulException):
         t = Text("In provider method")
         with t.indented_block():
             t.newline(
-                f"{sname(self.provider)}.provide_{self.provides.name}"
+                f"{sname(self.provider)}.{self.provides.provider_method_name}"
                 f"(..., {self.parameter_name}: {sname(self.mismatched_type)}, "
                 f"...) -> {sname(self.provides.type)}"
             )
@@ -536,7 +536,7 @@ class CannotDependOnResourceFromAnotherProvider(HelpfulException):
         resource = self.parameter_resource
         with t.indented_block():
             t.newline(
-                f"{sname(self.provider)}.provide_{self.provides.name}"
+                f"{sname(self.provider)}.{self.provides.provider_method_name}"
                 f"(..., {self.parameter_name}: {sname(resource.provider)}.{resource.name}, "
                 f"...) -> {sname(self.provides.type)}"
             )
@@ -572,7 +572,7 @@ class CannotDependOnParentProviderResource(HelpfulException):
         resource = self.parameter_resource
         with t.indented_block():
             t.newline(
-                f"{sname(self.provider)}.provide_{self.provides.name}"
+                f"{sname(self.provider)}.{self.provides.provider_method_name}"
                 f"(..., {self.parameter_name}: {sname(resource.provider)}.{resource.name}, "
                 f"...) -> {sname(self.provides.type)}"
             )
@@ -587,7 +587,7 @@ class CannotDependOnParentProviderResource(HelpfulException):
         t.sentence("If that's the case, you should write it as:")
         with t.indented_block():
             t.newline(
-                f"{sname(self.provider)}.provide_{self.provides.name}"
+                f"{sname(self.provider)}.{self.provides.provider_method_name}"
                 f"(..., {self.parameter_name}: {sname(resource.type)}, "
                 f"...) -> {sname(self.provides.type)}"
             )
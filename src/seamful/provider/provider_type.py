@@ -1,15 +1,14 @@
 from __future__ import annotations
 
 import inspect
-from dataclasses import dataclass
-from itertools import islice
+from types import FunctionType
 from typing import (
     Any,
+    Mapping,
     Generic,
     Iterable,
     Callable,
     TypeVar,
-    TYPE_CHECKING,
     Optional,
     Iterator,
     cast,
@@ -25,6 +24,8 @@ from seamful.resource import (
     ResourceKind,
     ProviderResource,
 )
+from seamful.errors import HelpfulException
+from seamful.module.module_type import ModuleType, Module
 from seamful.provider.errors import (
     MissingProviderMethod,
     ProviderMethodNotCallable,
@@ -60,15 +61,80 @@ from seamful.provider.errors import (
 
 T = TypeVar("T")
 
-if TYPE_CHECKING:
-    from seamful.module.module_type import ModuleType
-
 RESERVED_PROVIDER_ATTRIBUTES = ("module", "resources")
 
+InvalidResourceKindError = Callable[["ProviderType", str, type], HelpfulException]
+
+# Resource kinds that can't be declared in a provider, depending on whether the resource name
+# matches a module resource or not.
+INVALID_KINDS_MATCHING_MODULE_RESOURCE: dict[Optional[ResourceKind], InvalidResourceKindError] = {
+    ResourceKind.MODULE: CannotDefineModuleResourceInProvider,
+    ResourceKind.PRIVATE: PrivateResourceCannotOccludeModuleResource,
+}
+INVALID_KINDS_NOT_MATCHING_MODULE_RESOURCE: dict[
+    Optional[ResourceKind], InvalidResourceKindError
+] = {
+    ResourceKind.MODULE: CannotDefineModuleResourceInProvider,
+    ResourceKind.OVERRIDE: OverridingResourceNameDoesntMatchModuleResource,
+}
+
+_MISSING: Any = object()
+
+
+def _get_method_signature(method: Any) -> tuple[tuple[str, ...], dict[str, Any]]:
+    """Get the parameter names (excluding self) and annotations of a provider method.
+
+    Plain functions are read straight from their code object, which is much cheaper than
+    building an inspect.Signature. Decorated methods, methods with an explicit __signature__ or
+    variadic parameters, and other callables go through inspect.signature.
+    """
+    if (
+        type(method) is FunctionType
+        and not hasattr(method, "__wrapped__")
+        and not hasattr(method, "__signature__")
+        and not method.__code__.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS)
+    ):
+        code = method.__code__
+        return (
+            code.co_varnames[1 : code.co_argcount + code.co_kwonlyargcount],
+            method.__annotations__,
+        )
+    signature = inspect.signature(method)
+    annotations = {
+        name: parameter.annotation
+        for name, parameter in signature.parameters.items()
+        if parameter.annotation is not parameter.empty
+    }
+    if signature.return_annotation is not signature.empty:
+        annotations["return"] = signature.return_annotation
+    # exclude first parameter (self)
+    return tuple(signature.parameters)[1:], annotations
+
+
+def _provided_resource(resource: BoundResource[T]) -> BoundResource[T]:
+    """The resource a provider method is registered for: overriding resources provide the module
+    resource they override."""
+    if type(resource) is OverridingResource:
+        return resource.overrides
+    return resource
+
+
+def _is_rebound(resource: BoundResource[Any], base_resource: BoundResource[Any]) -> bool:
+    """Whether a provider resource with the same name is base_resource rebound to a sub provider.
+
+    Both resources are looked up by name, and resource belongs to the sub provider, so only the
+    remaining fields need to be compared.
+    """
+    if type(resource) is not type(base_resource) or resource.type != base_resource.type:
+        return False
+    if type(resource) is OverridingResource:
+        return resource.overrides == cast(OverridingResource[Any], base_resource).overrides
+    return True
+
 
 class ProviderType(type):
     _resources_by_name: dict[str, ProviderResource[Any]]
-    _resources: set[ProviderResource[Any]]
+    _resources_tuple: tuple[ProviderResource[Any], ...]
     _provider_methods_by_resource: dict[BoundResource[Any], ProviderMethod[Any]]
     _bases: tuple[ProviderType, ...]
 
@@ -83,7 +149,7 @@ class ProviderType(type):
         type.__init__(self, name, bases, dct)
         self._provider_methods_by_resource = {}
         self._resources_by_name = {}
-        self._resources = set()
+        self._resources_tuple = tuple()
         if len(bases) == 0:
             self._bases = tuple()
             return
@@ -91,9 +157,13 @@ class ProviderType(type):
             raise ProvidersDontSupportMultipleInheritance(self, bases)
         base_provider = bases[0]
         self._module = self._get_module_from_class_declaration(base_provider, module)
-        self._collect_resources(dct, base_provider)
+        declared_methods = self._collect_resources(dct, base_provider)
+        self._resources_tuple = tuple(self._resources_by_name.values())
         self._bases = (base_provider, *base_provider._bases)
-        self._collect_provider_methods()
+        self._collect_provider_methods(declared_methods)
+        # only expose the bound resources once the whole provider is valid.
+        for resource in self._resources_tuple:
+            setattr(self, resource.name, resource)
 
     def __call__(self, *args: Any, **kwargs: Any) -> None:
         raise ProvidersCannotBeInstantiated(self)
@@ -102,12 +172,15 @@ class ProviderType(type):
         return iter(self._provider_methods_by_resource.values())
 
     def __getitem__(self, resource: BoundResource[T]) -> ProviderMethod[T]:
+        # Module and private resources of this provider are keys of the provider methods map,
+        # so the common case needs no further validation.
+        provider_method = self._provider_methods_by_resource.get(resource)
+        if provider_method is not None:
+            return provider_method
         self._ensure_related_resource(resource)
-        target_resource = (
-            resource.overrides if isinstance(resource, OverridingResource) else resource
-        )
-        provider_method = self._provider_methods_by_resource[target_resource]
-        return provider_method
+        # Only overriding resources get here, their provider method is bound to the module
+        # resource they override.
+        return self._provider_methods_by_resource[cast(OverridingResource[T], resource).overrides]
 
     @property
     def module(self) -> ModuleType:
@@ -121,13 +194,11 @@ class ProviderType(type):
     def resources(
         self,
     ) -> Iterable[ProviderResource[Any]]:
-        return self._resources
+        return self._resources_tuple
 
     def _get_module_from_class_declaration(
         self, base: type, module: Optional[ModuleType]
     ) -> ModuleType:
-        from seamful.module.module_type import ModuleType, Module
-
         if base is Provider:
             if module is None:
                 raise ProviderDeclarationMissingModule(self)
@@ -144,67 +215,158 @@ class ProviderType(type):
         else:
             raise ProvidersMustInheritFromProviderClass(self, base)
 
-    def _collect_provider_methods(self) -> None:
-        for provider_resource in self._resources:
-            provider_method = self._build_provider_method(provider_resource)
+    def _collect_provider_methods(self, declared_methods: dict[str, FunctionType]) -> None:
+        # resources that provider method parameters can refer to by name. Provider resources
+        # shadow module resources with the same name. Providers without resources of their own
+        # share the module's map, which is never modified after the module is created.
+        resources_by_name: Mapping[str, BoundResource[Any]] = self._module._resources_by_name
+        if self._resources_by_name:
+            resources_by_name = {**resources_by_name, **self._resources_by_name}
+        for provider_resource in self._resources_tuple:
+            provider_method = self._get_inherited_provider_method(
+                provider_resource, declared_methods
+            ) or self._build_provider_method(provider_resource, declared_methods, resources_by_name)
             self._add_provider_method(provider_method)
         for module_resource in self._module:
             if module_resource.name in self._resources_by_name:
                 continue
-            provider_method = self._build_provider_method(module_resource)
+            provider_method = self._get_inherited_provider_method(
+                module_resource, declared_methods
+            ) or self._build_provider_method(module_resource, declared_methods, resources_by_name)
             self._add_provider_method(provider_method)
 
+    def _get_inherited_provider_method(
+        self, resource: BoundResource[T], declared_methods: dict[str, FunctionType]
+    ) -> Optional[ProviderMethod[T]]:
+        """Reuse the base provider's method for a resource if it would be built the same way.
+
+        That is the case when the method itself is inherited, the resource is a module resource
+        or a provider resource inherited as is, and each dependency still resolves to the same
+        resource (or to its counterpart in this provider).
+        """
+        if resource.provider_method_name in declared_methods:
+            return None
+        base_provider = self._bases[0]
+        base_resource: BoundResource[Any] = resource
+        if type(resource) is not ModuleResource:
+            inherited_resource = base_provider._resources_by_name.get(resource.name)
+            if inherited_resource is None or not _is_rebound(resource, inherited_resource):
+                return None
+            base_resource = inherited_resource
+        base_provider_method = base_provider._provider_methods_by_resource.get(
+            _provided_resource(base_resource)
+        )
+        if base_provider_method is None:
+            return None
+        if getattr(self, resource.provider_method_name, None) is not base_provider_method.method:
+            return None
+        dependencies = []
+        rebound_dependencies = False
+        for name, dependency in base_provider_method.dependencies:
+            if type(dependency) is ModuleResource:
+                if name in self._resources_by_name:
+                    return None
+            else:
+                # provider resources are always resolved by name.
+                rebound = self._resources_by_name.get(name)
+                if rebound is None or not _is_rebound(rebound, dependency):
+                    return None
+                dependency = rebound
+                rebound_dependencies = True
+            dependencies.append((name, dependency))
+        return ProviderMethod(
+            provider=self,
+            method=base_provider_method.method,
+            resource=_provided_resource(resource),
+            # module resource dependencies are shared with the base provider's method.
+            dependencies=(
+                tuple(dependencies) if rebound_dependencies else base_provider_method.dependencies
+            ),
+        )
+
     def _build_provider_method(
         self,
         resource: BoundResource[T],
+        declared_methods: dict[str, FunctionType],
+        resources_by_name: Mapping[str, BoundResource[Any]],
     ) -> ProviderMethod[T]:
-        method = getattr(self, f"provide_{resource.name}", None)
+        method = declared_methods.get(resource.provider_method_name)
+        if method is None:
+            # inherited, or not a plain function.
+            method = getattr(self, resource.provider_method_name, None)
         if method is None:
             raise MissingProviderMethod(resource, self)
         if not callable(method):
             raise ProviderMethodNotCallable(resource, self)
-        signature = inspect.signature(method)
-        if signature.return_annotation is signature.empty:
+        parameter_names, annotations = _get_method_signature(method)
+        return_type = annotations.get("return", _MISSING)
+        if return_type is _MISSING:
             raise ProviderMethodMissingReturnTypeAnnotation(self, resource, method)
-        if not resource.is_supertype_of(signature.return_annotation):
+        if not resource.is_supertype_of(return_type):
             raise ProviderMethodReturnTypeMismatch(
-                self, resource, method, mismatched_type=signature.return_annotation
+                self, resource, method, mismatched_type=return_type
             )
-        method_dependencies = tuple(self._get_parameter_resources(signature, resource, method))
-
-        bound_resource = (
-            resource.overrides if isinstance(resource, OverridingResource) else resource
+        method_dependencies = self._get_parameter_resources(
+            parameter_names, annotations, resources_by_name, resource, method
         )
+
         return ProviderMethod(
             provider=self,
             method=method,
-            resource=bound_resource,
+            resource=_provided_resource(resource),
             dependencies=method_dependencies,
         )
 
     def _get_parameter_resources(
         self,
-        signature: inspect.Signature,
+        parameter_names: tuple[str, ...],
+        annotations: dict[str, Any],
+        resources_by_name: Mapping[str, BoundResource[Any]],
         target: BoundResource[Any],
         method: Any,
-    ) -> Iterable[tuple[str, BoundResource[Any]]]:
-        # exclude first parameter (self)
-        for name, parameter in islice(signature.parameters.items(), 1, None):
-            yield name, self._get_parameter_resource(name, parameter, target, method)
+    ) -> tuple[tuple[str, BoundResource[Any]], ...]:
+        if not parameter_names:
+            return ()
+        get_annotation = annotations.get
+        get_parameter_resource = self._get_parameter_resource
+        return tuple(
+            [
+                (
+                    name,
+                    get_parameter_resource(
+                        name, get_annotation(name, _MISSING), resources_by_name, target, method
+                    ),
+                )
+                for name in parameter_names
+            ]
+        )
 
     def _get_parameter_resource(
         self,
         name: str,
-        parameter: inspect.Parameter,
+        parameter_type: Any,
+        resources_by_name: Mapping[str, BoundResource[Any]],
         target: BoundResource[Any],
         method: Any,
     ) -> BoundResource[Any]:
-        parameter_type: Any = parameter.annotation
-        if parameter_type is inspect.Signature.empty:
+        if parameter_type is _MISSING:
             raise ProviderMethodParameterMissingTypeAnnotation(
                 self, target, method, parameter_name=name
             )
 
+        if isinstance(parameter_type, type):
+            # the common case: the parameter type is not a resource. We match the parameter's
+            # name with the provider's and module's resource names.
+            resource = resources_by_name.get(name)
+            if resource is None:
+                raise ProviderMethodParameterUnrelatedName(
+                    self, target, method, name, parameter_type
+                )
+            self._ensure_parameter_type_satisfies_resource_type(
+                parameter_type, resource, target, name
+            )
+            return resource
+
         if isinstance(parameter_type, ModuleResource):
             return parameter_type
 
@@ -214,28 +376,9 @@ class ProviderType(type):
             # when providers can be subclassed, part of this is a valid use case.
             raise CannotDependOnResourceFromAnotherProvider(self, target, parameter_type, name)
 
-        if not isinstance(parameter_type, type):
-            raise ProviderMethodParameterInvalidTypeAnnotation(
-                self, target, method, name, parameter_type
-            )
-
-        # the parameter type is not a resource. We match the parameter's name with
-        # the module's resource names.
-
-        if name in self._resources_by_name:
-            provider_resource = self._resources_by_name[name]
-            self._ensure_parameter_type_satisfies_resource_type(
-                parameter_type, provider_resource, target, name
-            )
-            return provider_resource
-        elif name in self._module:
-            module_resource = self._module[name]
-            self._ensure_parameter_type_satisfies_resource_type(
-                parameter_type, module_resource, target, name
-            )
-            return module_resource
-        else:
-            raise ProviderMethodParameterUnrelatedName(self, target, method, name, parameter_type)
+        raise ProviderMethodParameterInvalidTypeAnnotation(
+            self, target, method, name, parameter_type
+        )
 
     def _ensure_parameter_type_satisfies_resource_type(
         self,
@@ -257,9 +400,15 @@ class ProviderType(type):
         self,
         dct: dict[str, Any],
         base_provider: ProviderType,
-    ) -> None:
+    ) -> dict[str, FunctionType]:
+        """Collect the provider resources, and return the provider methods declared in dct."""
+        declared_methods = {}
         for name, candidate in dct.items():
-            if name.startswith("_") or name.startswith("provide_"):
+            if name.startswith("_"):
+                continue
+            if name.startswith("provide_"):
+                if type(candidate) is FunctionType:
+                    declared_methods[name] = candidate
                 continue
             resource = self._collect_resource(name, candidate)
             self._add_resource(resource)
@@ -276,68 +425,81 @@ class ProviderType(type):
                     )
             else:
                 self._add_resource(base_resource.bound_to_sub_provider(self))
+        return declared_methods
 
     def _collect_resource(self, name: str, candidate: Any) -> ProviderResource[Any]:
         if name in RESERVED_PROVIDER_ATTRIBUTES:
             raise InvalidProviderAttributeName(self, name, candidate, RESERVED_PROVIDER_ATTRIBUTES)
-        if isinstance(candidate, UnboundResource):
-            if name in self._module:
-                if candidate.kind == ResourceKind.MODULE:
-                    raise CannotDefineModuleResourceInProvider(self, name, candidate.type)
-                elif candidate.kind == ResourceKind.PRIVATE:
-                    raise PrivateResourceCannotOccludeModuleResource(self, name, candidate.type)
-                return OverridingResource(candidate.type, name, self, self._module[name])
+        module_resource = self._module._resources_by_name.get(name)
+        candidate_type = type(candidate)
+        if candidate_type is UnboundResource:
+            if module_resource is not None:
+                invalid_kind_error = INVALID_KINDS_MATCHING_MODULE_RESOURCE.get(candidate.kind)
+                if invalid_kind_error is not None:
+                    raise invalid_kind_error(self, name, candidate.type)
+                return OverridingResource(candidate.type, name, self, module_resource)
             else:
-                if candidate.kind == ResourceKind.OVERRIDE:
-                    raise OverridingResourceNameDoesntMatchModuleResource(
-                        self, name, candidate.type
-                    )
-                if candidate.kind == ResourceKind.MODULE:
-                    raise CannotDefineModuleResourceInProvider(self, name, candidate.type)
+                invalid_kind_error = INVALID_KINDS_NOT_MATCHING_MODULE_RESOURCE.get(candidate.kind)
+                if invalid_kind_error is not None:
+                    raise invalid_kind_error(self, name, candidate.type)
                 return PrivateResource(candidate.type, name, self)
-        elif isinstance(candidate, BoundResource):
+        elif (
+            candidate_type is ModuleResource
+            or candidate_type is PrivateResource
+            or candidate_type is OverridingResource
+        ):
             raise ResourceDefinitionCannotReferToExistingResource(self, name, candidate)
         elif isinstance(candidate, type):
-            if name in self._module:
-                overrides = self._module[name]
-                overriding_resource = OverridingResource[Any](candidate, name, self, overrides)
-                if not overriding_resource.is_subtype_of(overrides.type):
-                    raise OverridingResourceIncompatibleType(overriding_resource, overrides)
+            # metaclasses other than type are valid too, so this one can't be an exact check.
+            if module_resource is not None:
+                overriding_resource = OverridingResource(candidate, name, self, module_resource)
+                if not overriding_resource.is_subtype_of(module_resource.type):
+                    raise OverridingResourceIncompatibleType(overriding_resource, module_resource)
                 return overriding_resource
             else:
-                return PrivateResource[Any](candidate, name, self)
+                return PrivateResource(candidate, name, self)
         else:
             raise InvalidProviderAttribute(self, name, candidate)
 
     def _add_resource(self, resource: ProviderResource[Any]) -> None:
         self._resources_by_name[resource.name] = resource
-        self._resources.add(resource)
-        setattr(self, resource.name, resource)
 
     def _add_provider_method(self, provider_method: ProviderMethod[Any]) -> None:
         self._provider_methods_by_resource[provider_method.resource] = provider_method
 
     def _ensure_related_resource(self, resource: BoundResource[Any]) -> None:
-        if isinstance(resource, ModuleResource):
+        if type(resource) is ModuleResource:
             if resource.module is not self._module:
                 raise ResourceModuleMismatch(self, resource)
-            elif resource not in self._module:
+            elif self._module._resources_by_name.get(resource.name) != resource:
                 raise UnknownModuleResource(self, resource)
-        elif isinstance(resource, (PrivateResource, OverridingResource)):
+        elif type(resource) is PrivateResource or type(resource) is OverridingResource:
             if resource.provider is not self:
                 raise ResourceProviderMismatch(self, resource)
-            if resource not in self._resources:
+            if self._resources_by_name.get(resource.name) != resource:
                 raise UnknownProviderResource(self, resource)
         else:
             raise TypeError()
 
 
-@dataclass(frozen=True)
 class ProviderMethod(Generic[T]):
-    method: Callable[..., T]
-    provider: ProviderType
-    resource: BoundResource[Any]
-    dependencies: Iterable[tuple[str, BoundResource[Any]]]
+    # one instance per resource per provider, created while the provider class is built.
+    __slots__ = ("method", "provider", "resource", "dependencies")
+
+    def __init__(
+        self,
+        method: Callable[..., T],
+        provider: ProviderType,
+        resource: BoundResource[Any],
+        dependencies: Iterable[tuple[str, BoundResource[Any]]],
+    ) -> None:
+        self.method = method
+        self.provider = provider
+        self.resource = resource
+        self.dependencies = dependencies
+
+    def __repr__(self) -> str:
+        return f"ProviderMethod({self.provider.__name__}.{self.resource.provider_method_name})"
 
 
 M = TypeVar("M")
@@ -1,4 +1,7 @@
-from typing import cast, Any, Union, List
+import inspect
+from collections.abc import Sized
+from functools import wraps
+from typing import cast, Any, Union, List, Callable
 from unittest import TestCase
 
 from seamful.application import Application
@@ -205,6 +208,33 @@ class TestProviderCollectingProviderMethods(TestCaseWithOutputFixtures):
         self.assertEqual(ctx.exception.resource, SomeModule.a)
         return ctx.exception
 
+    def test_provider_method_lookup_by_provider_resources(self) -> None:
+        class SomeBaseClass:
+            pass
+
+        class SomeConcreteClass(SomeBaseClass):
+            pass
+
+        class SomeModule(Module):
+            a = SomeBaseClass
+
+        class SomeProvider(Provider, module=SomeModule):
+            a = SomeConcreteClass
+            b = Resource(int)
+
+            def provide_a(self) -> SomeConcreteClass:
+                return SomeConcreteClass()
+
+            def provide_b(self) -> int:
+                return 10
+
+        overriding_method = SomeProvider[SomeProvider.a]  # type: ignore
+        self.assertIs(overriding_method, SomeProvider[SomeModule.a])  # type: ignore
+        self.assertIs(overriding_method.resource, SomeModule.a)
+        private_method = SomeProvider[SomeProvider.b]  # type: ignore
+        self.assertIs(private_method.method, SomeProvider.provide_b)
+        self.assertIs(private_method.resource, SomeProvider.b)
+
     @validate_output
     def test_provider_method_lookup_unknown_module_resource(self) -> HelpfulException:
         class SomeModule(Module):
@@ -672,6 +702,67 @@ class TestProviderMethodFromSignature(TestCaseWithOutputFixtures):
         provider_method = SomeProvider[SomeModule.a]  # type: ignore
         self.assertEqual(dict(provider_method.dependencies), dict(b=SomeModule.b))
 
+    def test_provider_method_parameters_can_be_keyword_only(self) -> None:
+        class SomeModule(Module):
+            a = int
+            b = int
+
+        class SomeProvider(Provider, module=SomeModule):
+            def provide_a(self, *, b: int) -> int:
+                return b + 1
+
+            def provide_b(self) -> int:
+                return 10
+
+        provider_method = SomeProvider[SomeModule.a]  # type: ignore
+        self.assertEqual(dict(provider_method.dependencies), dict(b=SomeModule.b))
+
+    def test_provider_method_signature_is_read_through_decorators(self) -> None:
+        def decorated(method: Callable[..., int]) -> Callable[..., int]:
+            @wraps(method)
+            def wrapper(*args: Any, **kwargs: Any) -> int:
+                return method(*args, **kwargs)
+
+            return wrapper
+
+        class SomeModule(Module):
+            a = int
+            b = int
+
+        class SomeProvider(Provider, module=SomeModule):
+            @decorated
+            def provide_a(self, b: int) -> int:
+                return b + 1
+
+            def provide_b(self) -> int:
+                return 10
+
+        provider_method = SomeProvider[SomeModule.a]  # type: ignore
+        self.assertEqual(dict(provider_method.dependencies), dict(b=SomeModule.b))
+
+    def test_provider_method_signature_is_read_from_explicit_signature(self) -> None:
+        class SomeModule(Module):
+            a = int
+            b = int
+
+        class SomeProvider(Provider, module=SomeModule):
+            def provide_a(self, b):  # type: ignore
+                return b + 1
+
+            provide_a.__signature__ = inspect.Signature(  # type: ignore
+                [
+                    inspect.Parameter("self", inspect.Parameter.POSITIONAL_OR_KEYWORD),
+                    inspect.Parameter("b", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=int),
+                ],
+                return_annotation=int,
+            )
+
+            def provide_b(self) -> int:
+                return 10
+
+        provider_method = SomeProvider[SomeModule.a]  # type: ignore
+        self.assertEqual(dict(provider_method.dependencies), dict(b=SomeModule.b))
+
     @validate_output
     def test_provider_method_must_either_match_by_resource_or_by_name(
         self,
@@ -1099,6 +1190,21 @@ class TestProviderMethodsForSpecialTypes(TestCase):
         self.assertEqual(resource.name, "a")
         self.assertEqual(resource.module, SomeModule)
 
+    def test_provider_and_module_allow_virtual_subclasses_of_abstract_types(self) -> None:
+        class SomeModule(Module):
+            a = Sized
+            b = int
+
+        class SomeProvider(Provider, module=SomeModule):
+            def provide_a(self) -> list:  # type: ignore
+                return []
+
+            def provide_b(self, a: Sized) -> int:
+                return len(a)
+
+        provider_method = SomeProvider[SomeModule.b]  # type: ignore
+        self.assertEqual(dict(provider_method.dependencies), dict(a=SomeModule.a))
+
     def test_resource_of_generic_type_is_not_type_checked(self) -> None:
         """This is not a feature, only test to document a limitation on signature checks."""
 
@@ -1214,6 +1320,101 @@ class TestProviderSubclasses(TestCaseWithOutputFixtures):
         self.assertEqual(len(list(AnotherProvider.resources)), 2)
         self.assertEqual(len(list(AnotherProvider)), 2)
 
+    def test_a_provider_subclass_binds_inherited_provider_methods_to_itself(self) -> None:
+        class SomeModule(Module):
+            a = int
+            b = int
+
+        class SomeProvider(Provider, module=SomeModule):
+            def provide_a(self, b: int) -> int:
+                return b + 1
+
+            def provide_b(self) -> int:
+                return 10
+
+        class AnotherProvider(SomeProvider):
+            pass
+
+        provider_method = AnotherProvider[SomeModule.a]  # type: ignore
+        self.assertIs(provider_method.provider, AnotherProvider)
+        self.assertIs(provider_method.method, SomeProvider.provide_a)
+        self.assertEqual(dict(provider_method.dependencies), dict(b=SomeModule.b))
+        self.assertIs(SomeProvider[SomeModule.a].provider, SomeProvider)  # type: ignore
+
+    def test_a_provider_subclass_rebinds_inherited_provider_method_dependencies(self) -> None:
+        class SomeModule(Module):
+            a = int
+            b = int
+
+        class SomeProvider(Provider, module=SomeModule):
+            def provide_a(self, b: int) -> int:
+                return b + 1
+
+            def provide_b(self) -> int:
+                return 10
+
+        class AnotherProvider(SomeProvider):
+            b = Resource(int, ResourceKind.OVERRIDE)
+
+            def provide_b(self) -> int:
+                return 11
+
+        provider_method = AnotherProvider[SomeModule.a]  # type: ignore
+        self.assertIs(provider_method.provider, AnotherProvider)
+        self.assertEqual(dict(provider_method.dependencies), dict(b=AnotherProvider.b))
+
+    def test_a_provider_subclass_rebinds_inherited_provider_resources(self) -> None:
+        class SomeModule(Module):
+            a = int
+
+        class SomeProvider(Provider, module=SomeModule):
+            a = Resource(int, ResourceKind.OVERRIDE)
+            b = Resource(int)
+
+            def provide_a(self, b: int) -> int:
+                return b + 1
+
+            def provide_b(self) -> int:
+                return 10
+
+        class AnotherProvider(SomeProvider):
+            pass
+
+        provider_method = AnotherProvider[AnotherProvider.b]  # type: ignore
+        self.assertIs(provider_method.provider, AnotherProvider)
+        self.assertEqual(provider_method.resource, AnotherProvider.b)
+        provider_method = AnotherProvider[SomeModule.a]  # type: ignore
+        self.assertIs(provider_method.provider, AnotherProvider)
+        self.assertIs(provider_method.method, SomeProvider.provide_a)
+        self.assertEqual(dict(provider_method.dependencies), dict(b=AnotherProvider.b))
+
+    def test_provider_resources_keep_declaration_order(self) -> None:
+        class SomeModule(Module):
+            pass
+
+        class SomeProvider(Provider, module=SomeModule):
+            c = Resource(int)
+            a = Resource(int)
+            b = Resource(int)
+
+            def provide_a(self) -> int:
+                return 10
+
+            def provide_b(self) -> int:
+                return 11
+
+            def provide_c(self) -> int:
+                return 12
+
+        class AnotherProvider(SomeProvider):
+            d = Resource(int)
+
+            def provide_d(self) -> int:
+                return 13
+
+        self.assertEqual([r.name for r in SomeProvider.resources], ["c", "a", "b"])
+        self.assertEqual([r.name for r in AnotherProvider.resources], ["d", "c", "a", "b"])
+
     @validate_output
     def test_provider_attribute_cannot_be_named_module(self) -> HelpfulException:
         class SomeModule(Module):
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from abc import ABC, abstractmethod
 from enum import Enum
 from typing import TypeVar, Generic, Type, TYPE_CHECKING, Optional
@@ -18,6 +19,8 @@ class ResourceKind(Enum):
 
 
 class UnboundResource(Generic[T]):
+    __slots__ = ("type", "kind")
+
     def __init__(self, t: Type[T], kind: Optional[ResourceKind]):
         self.type = t
         self.kind = kind
@@ -27,25 +30,39 @@ class UnboundResource(Generic[T]):
 
 
 class BoundResource(Generic[T], ABC):
+    # resources are created for every declaration and provider subclass, keep them small.
+    __slots__ = ("type", "name", "module", "provider_method_name", "_hash")
+
     def __init__(self, t: Type[T], name: str, module: ModuleType):
         self.type = t
-        self.name = name
+        # Resource names are used as keys on every resource and provider method lookup.
+        self.name = sys.intern(name)
         self.module = module
+        self.provider_method_name = sys.intern(f"provide_{name}")
 
     def is_subtype_of(self, of: Type[T]) -> bool:
+        if of is self.type:
+            return True
         if not isinstance(self.type, type) or not isinstance(of, type):
             # Typing constructs such as Sequence, Union[], are not types, so when
             # we have resources that are bound to something other than types, we just allow them
             # through.
             return True
-        return issubclass(self.type, of)
+        # Most checks are satisfied by a plain base class, which doesn't need to go through
+        # __subclasscheck__. issubclass still handles the rest, such as ABC registrations.
+        return of in self.type.__mro__ or issubclass(self.type, of)
 
     def is_supertype_of(self, of: Type[T]) -> bool:
+        if of is self.type:
+            # the usual case, a provider method annotated with the exact resource type.
+            return True
         if not isinstance(self.type, type) or not isinstance(of, type):
             # Typing constructs such as Sequence, Union[], are not types, so when
             # we have resources that are bound to something other than types, we just allow them
             # through.
             return True
+        if self.type in of.__mro__:
+            return True
         try:
             return issubclass(of, self.type)
         except TypeError:
@@ -57,8 +74,15 @@ class BoundResource(Generic[T], ABC):
 
 
 class ModuleResource(BoundResource[T]):
+    __slots__ = ()
+
+    def __init__(self, t: Type[T], name: str, module: ModuleType):
+        super().__init__(t, name, module)
+        # resources are immutable and used as keys on every lookup, so their hash is computed once.
+        self._hash = hash((self.__class__, self.type, self.name, self.module))
+
     def __hash__(self) -> int:
-        return hash((self.__class__, self.type, self.name, self.module))
+        return self._hash
 
     def __repr__(self) -> str:
         return f"ModuleResource('{self.name}', {self.type.__name__}, {self.module.__name__})"
@@ -74,6 +98,8 @@ class ModuleResource(BoundResource[T]):
 
 
 class ProviderResource(BoundResource[T], ABC):
+    __slots__ = ("provider",)
+
     def __init__(self, t: Type[T], name: str, provider: ProviderType):
         super().__init__(t, name, provider.module)
         self.provider = provider
@@ -84,11 +110,17 @@ class ProviderResource(BoundResource[T], ABC):
 
 
 class PrivateResource(ProviderResource[T]):
+    __slots__ = ()
+
+    def __init__(self, t: Type[T], name: str, provider: ProviderType):
+        super().__init__(t, name, provider)
+        self._hash = hash((self.__class__, self.type, self.name, self.provider))
+
     def bound_to_sub_provider(self, provider: ProviderType) -> PrivateResource[T]:
         return PrivateResource(self.type, self.name, provider)
 
     def __hash__(self) -> int:
-        return hash((self.__class__, self.type, self.name, self.provider))
+        return self._hash
 
     def __repr__(self) -> str:
         return f"PrivateResource('{self.name}', {self.type.__name__}, {self.provider.__name__})"
@@ -104,16 +136,19 @@ class PrivateResource(ProviderResource[T]):
 
 
 class OverridingResource(ProviderResource[T]):
+    __slots__ = ("overrides",)
+
     def __init__(self, t: Type[T], name: str, provider: ProviderType, overrides: ModuleResource[T]):
         assert provider.module is overrides.module
         super().__init__(t, name, provider)
         self.overrides = overrides
+        self._hash = hash((self.__class__, self.type, self.name, self.provider, self.overrides))
 
     def bound_to_sub_provider(self, provider: ProviderType) -> OverridingResource[T]:
         return OverridingResource(self.type, self.name, provider, self.overrides)
 
     def __hash__(self) -> int:
-        return hash((self.__class__, self.type, self.name, self.provider, self.overrides))
+        return self._hash
 
     def __repr__(self) -> str:
         return (